@@ -11,12 +11,14 @@ import "./libraries/CalldataValidation.sol";
  *******************************************************/
 contract Allowlist is IAllowlist, Ownable {
   using JsonWriter for JsonWriter.Json; // Initialize JSON writer
-  string[] public conditionsIds; // Array of condition IDs
-  mapping(string => Condition) public conditionById; // Condition ID to condition mapping
+  bytes32[] public conditionsKeys; // Array of condition keys
+  mapping(bytes32 => Condition) public conditionByKey; // Condition key to condition mapping
+  mapping(bytes32 => uint256) public conditionPositionByKey; // Condition key to index in conditionsKeys (plus one, zero if missing)
   string public name; // Domain name of protocol (ie. "yearn.finance")
   address public allowlistFactoryAddress; // Address of root allowlist (parent/factory)
-  mapping(string => address) public implementationById; // Implementation ID to implementation address mapping
-  string[] public implementationsIds; // Array of implementation IDs
+  mapping(bytes32 => address) public implementationByKey; // Implementation key to implementation address mapping
+  mapping(bytes32 => string) public implementationIdByKey; // Implementation key to implementation ID mapping
+  bytes32[] public implementationsKeys; // Array of implementation keys
 
   /**
    * @notice Initialize the contract (this will only be called by proxy)
@@ -32,6 +34,21 @@ contract Allowlist is IAllowlist, Ownable {
     ownerAddress = _ownerAddress;
   }
 
+  /*******************************************************
+   *                      Key Logic
+   *******************************************************/
+
+  /**
+   * @notice Derive the storage key for a condition or implementation ID
+   * @dev All internal mappings and indexes are keyed by this value, string IDs are
+   *      only translated at the edges of the public API
+   * @param id The condition or implementation ID (ie. "VAULT_VALIDATIONS")
+   * @return Returns keccak256 of the ID
+   */
+  function keyById(string memory id) public pure returns (bytes32) {
+    return keccak256(bytes(id));
+  }
+
   /*******************************************************
    *                   Implementation Logic
    *******************************************************/
@@ -45,15 +62,17 @@ contract Allowlist is IAllowlist, Ownable {
     string memory implementationId,
     address implementationAddress
   ) public onlyOwner {
-    // Add implementation ID to the implementationsIds list if it doesn't exist
-    bool implementationExists = implementationById[implementationId] !=
+    // Add implementation key to the implementationsKeys list if it doesn't exist
+    bytes32 implementationKey = keyById(implementationId);
+    bool implementationExists = implementationByKey[implementationKey] !=
       address(0);
     if (!implementationExists) {
-      implementationsIds.push(implementationId);
+      implementationsKeys.push(implementationKey);
+      implementationIdByKey[implementationKey] = implementationId;
     }
 
     // Set implementation
-    implementationById[implementationId] = implementationAddress;
+    implementationByKey[implementationKey] = implementationAddress;
 
     // Validate implementation against existing conditions
     validateConditions();
@@ -77,27 +96,65 @@ contract Allowlist is IAllowlist, Ownable {
     }
   }
 
+  /**
+   * @notice Fetch an implementation address given an ID
+   * @param implementationId The ID of the implementation
+   * @return Returns the implementation address (zero address if not set)
+   */
+  function implementationById(string memory implementationId)
+    public
+    view
+    returns (address)
+  {
+    return implementationByKey[keyById(implementationId)];
+  }
+
+  /**
+   * @notice Fetch an implementation ID given its index
+   * @param implementationIdx The index of the implementation
+   * @return Returns the implementation ID
+   */
+  function implementationsIds(uint256 implementationIdx)
+    public
+    view
+    returns (string memory)
+  {
+    return implementationIdByKey[implementationsKeys[implementationIdx]];
+  }
+
   function implementationsIdsList() public view returns (string[] memory) {
-    return implementationsIds;
+    string[] memory _implementationsIds = new string[](
+      implementationsKeys.length
+    );
+    for (
+      uint256 implementationIdx;
+      implementationIdx < implementationsKeys.length;
+      implementationIdx++
+    ) {
+      _implementationsIds[implementationIdx] = implementationIdByKey[
+        implementationsKeys[implementationIdx]
+      ];
+    }
+    return _implementationsIds;
+  }
+
+  function implementationsKeysList() public view returns (bytes32[] memory) {
+    return implementationsKeys;
   }
 
   function implementationsList() public view returns (Implementation[] memory) {
-    string[] memory _implementationsIdsList = implementationsIdsList();
     Implementation[] memory implementations = new Implementation[](
-      _implementationsIdsList.length
+      implementationsKeys.length
     );
     for (
       uint256 implementationIdx;
-      implementationIdx < _implementationsIdsList.length;
+      implementationIdx < implementationsKeys.length;
       implementationIdx++
     ) {
-      string memory implementationId = _implementationsIdsList[
-        implementationIdx
-      ];
-      address implementationAddress = implementationById[implementationId];
+      bytes32 implementationKey = implementationsKeys[implementationIdx];
       implementations[implementationIdx] = Implementation({
-        id: implementationId,
-        addr: implementationAddress
+        id: implementationIdByKey[implementationKey],
+        addr: implementationByKey[implementationKey]
       });
     }
     return implementations;
@@ -114,8 +171,9 @@ contract Allowlist is IAllowlist, Ownable {
    */
   function _addCondition(Condition memory condition) internal {
     // Condition ID must be unique
+    bytes32 conditionKey = keyById(condition.id);
     require(
-      conditionExists(condition.id) == false,
+      conditionPositionByKey[conditionKey] == 0,
       "Condition with this ID already exists"
     );
 
@@ -124,8 +182,24 @@ contract Allowlist is IAllowlist, Ownable {
     require(idHasSpaces == false, "Condition IDs cannot have spaces");
 
     // Add condition
-    conditionById[condition.id] = condition;
-    conditionsIds.push(condition.id);
+    conditionByKey[conditionKey] = condition;
+    conditionsKeys.push(conditionKey);
+    conditionPositionByKey[conditionKey] = conditionsKeys.length;
+  }
+
+  /**
+   * @dev Internal method for deleting a condition given its key
+   * @dev The last condition is moved into the slot of the deleted condition
+   */
+  function _deleteCondition(bytes32 conditionKey) internal {
+    uint256 conditionPosition = conditionPositionByKey[conditionKey];
+    require(conditionPosition != 0, "Cannot find condition with that ID");
+    bytes32 lastConditionKey = conditionsKeys[conditionsKeys.length - 1];
+    conditionsKeys[conditionPosition - 1] = lastConditionKey;
+    conditionPositionByKey[lastConditionKey] = conditionPosition;
+    conditionsKeys.pop();
+    delete conditionPositionByKey[conditionKey];
+    delete conditionByKey[conditionKey];
   }
 
   /**
@@ -186,21 +260,7 @@ contract Allowlist is IAllowlist, Ownable {
    * @param conditionId The ID of the condition to delete
    */
   function deleteCondition(string memory conditionId) public onlyOwner {
-    string memory lastConditionId = conditionsIds[conditionsIds.length - 1];
-    for (
-      uint256 conditionIdx;
-      conditionIdx < conditionsIds.length;
-      conditionIdx++
-    ) {
-      string memory currentConditionId = conditionsIds[conditionIdx];
-      if (Strings.stringsEqual(currentConditionId, conditionId)) {
-        conditionsIds[conditionIdx] = lastConditionId;
-        conditionsIds.pop();
-        delete conditionById[conditionId];
-        return;
-      }
-    }
-    revert("Cannot find condition with that ID");
+    _deleteCondition(keyById(conditionId));
   }
 
   /**
@@ -222,14 +282,8 @@ contract Allowlist is IAllowlist, Ownable {
    * @notice Delete every condition
    */
   function deleteAllConditions() public onlyOwner {
-    uint256 _conditionsLength = conditionsIds.length;
-    for (
-      uint256 conditionIdx;
-      conditionIdx < _conditionsLength;
-      conditionIdx++
-    ) {
-      string memory conditionId = conditionsIds[0];
-      deleteCondition(conditionId);
+    while (conditionsKeys.length > 0) {
+      _deleteCondition(conditionsKeys[conditionsKeys.length - 1]);
     }
   }
 
@@ -252,17 +306,46 @@ contract Allowlist is IAllowlist, Ownable {
    * @return Returns all conditions
    */
   function conditionsList() public view returns (Condition[] memory) {
-    Condition[] memory _conditions = new Condition[](conditionsIds.length);
+    Condition[] memory _conditions = new Condition[](conditionsKeys.length);
     for (
       uint256 conditionIdx;
-      conditionIdx < conditionsIds.length;
+      conditionIdx < conditionsKeys.length;
       conditionIdx++
     ) {
-      _conditions[conditionIdx] = conditionById[conditionsIds[conditionIdx]];
+      _conditions[conditionIdx] = conditionByKey[conditionsKeys[conditionIdx]];
     }
     return _conditions;
   }
 
+  /**
+   * @notice Fetch a list of conditions along with their implementation addresses
+   * @dev Lets validators resolve every implementation with a single external call
+   * @return conditions Returns all conditions
+   * @return implementationAddresses Returns the implementation address of each condition
+   */
+  function conditionsListWithImplementations()
+    public
+    view
+    returns (
+      Condition[] memory conditions,
+      address[] memory implementationAddresses
+    )
+  {
+    conditions = new Condition[](conditionsKeys.length);
+    implementationAddresses = new address[](conditionsKeys.length);
+    for (
+      uint256 conditionIdx;
+      conditionIdx < conditionsKeys.length;
+      conditionIdx++
+    ) {
+      Condition memory condition = conditionByKey[conditionsKeys[conditionIdx]];
+      conditions[conditionIdx] = condition;
+      implementationAddresses[conditionIdx] = implementationByKey[
+        keyById(condition.implementationId)
+      ];
+    }
+  }
+
   /**
    * @notice Fetch current conditions list as JSON
    * @return Returns JSON representation of conditions list
@@ -340,15 +423,63 @@ contract Allowlist is IAllowlist, Ownable {
    * @return An array of condition IDs
    */
   function conditionsIdsList() public view returns (string[] memory) {
-    return conditionsIds;
+    string[] memory _conditionsIds = new string[](conditionsKeys.length);
+    for (
+      uint256 conditionIdx;
+      conditionIdx < conditionsKeys.length;
+      conditionIdx++
+    ) {
+      _conditionsIds[conditionIdx] = conditionByKey[conditionsKeys[conditionIdx]]
+        .id;
+    }
+    return _conditionsIds;
+  }
+
+  /**
+   * @notice Fetch a list of all condition keys
+   * @return An array of condition keys
+   */
+  function conditionsKeysList() public view returns (bytes32[] memory) {
+    return conditionsKeys;
+  }
+
+  /**
+   * @notice Fetch a condition ID given its index
+   * @param conditionIdx The index of the condition
+   * @return Returns the condition ID
+   */
+  function conditionsIds(uint256 conditionIdx)
+    public
+    view
+    returns (string memory)
+  {
+    return conditionByKey[conditionsKeys[conditionIdx]].id;
+  }
+
+  /**
+   * @notice Fetch a condition given an ID
+   * @dev Mirrors the public getter of conditionByKey (array members are omitted)
+   * @param conditionId The ID of the condition
+   */
+  function conditionById(string memory conditionId)
+    public
+    view
+    returns (
+      string memory id,
+      string memory implementationId,
+      string memory methodName
+    )
+  {
+    Condition storage condition = conditionByKey[keyById(conditionId)];
+    return (condition.id, condition.implementationId, condition.methodName);
   }
 
   /**
    * @notice Fetch the total number of conditions in this contract
-   * @return Returns length of conditionIds
+   * @return Returns length of conditionsKeys
    */
   function conditionsLength() public view returns (uint256) {
-    return conditionsIds.length;
+    return conditionsKeys.length;
   }
 
   /**
@@ -358,9 +489,10 @@ contract Allowlist is IAllowlist, Ownable {
    */
   function conditionExists(string memory conditionId)
     public
+    view
     returns (bool exists)
   {
-    return !Strings.stringsEqual(conditionById[conditionId].id, "");
+    return conditionPositionByKey[keyById(conditionId)] != 0;
   }
 
   /*******************************************************
@@ -373,6 +505,9 @@ contract Allowlist is IAllowlist, Ownable {
    */
   function validateCondition(Condition memory condition) public view {
     string[][] memory requirements = condition.requirements;
+    address implementationAddress = implementationByKey[
+      keyById(condition.implementationId)
+    ];
 
     for (
       uint256 requirementIdx;
@@ -418,9 +553,6 @@ contract Allowlist is IAllowlist, Ownable {
         revert("Unsupported requirement type");
       }
 
-      address implementationAddress = implementationById[
-        condition.implementationId
-      ];
       require(
         implementationAddress != address(0),
         "Implementation address is not set"
@@ -444,11 +576,11 @@ contract Allowlist is IAllowlist, Ownable {
   function validateConditions() public view {
     for (
       uint256 conditionIdx;
-      conditionIdx < conditionsIds.length;
+      conditionIdx < conditionsKeys.length;
       conditionIdx++
     ) {
-      string memory conditionId = conditionsIds[conditionIdx];
-      Condition memory condition = conditionById[conditionId];
+      bytes32 conditionKey = conditionsKeys[conditionIdx];
+      Condition memory condition = conditionByKey[conditionKey];
       validateCondition(condition);
     }
   }
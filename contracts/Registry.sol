@@ -19,6 +19,14 @@ contract AllowlistRegistry {
   string[] public registeredProtocols; // Array of all protocols which have successfully completed registration
   mapping(string => address) public allowlistAddressByOriginName; // Address of protocol specific allowlist
 
+  struct ProtocolSnapshot {
+    string originName;
+    address allowlistAddress;
+    address ownerAddress;
+    IAllowlist.Implementation[] implementations;
+    bytes conditions; // ABI-encoded IAllowlist.Condition[]
+  }
+
   constructor(address _factoryAddress) {
     factoryAddress = _factoryAddress;
   }
@@ -79,6 +87,63 @@ contract AllowlistRegistry {
     return registeredProtocols;
   }
 
+  /**
+   * @notice Fetch the total number of registered protocols
+   * @return Returns length of registeredProtocols
+   */
+  function registeredProtocolsLength() public view returns (uint256) {
+    return registeredProtocols.length;
+  }
+
+  /**
+   * @notice Fetch a page of registered protocols along with their allowlist state
+   * @dev Intended for indexers, replaces one call per protocol per field with one call per page
+   * @dev The page is truncated if it extends past the end of registeredProtocols
+   * @dev Conditions are the raw return data of each allowlist's "conditionsList()"
+   *      (ABI-encoded IAllowlist.Condition[]), forwarded without being decoded
+   * @dev The whole page runs in one eth_call, so count must stay small enough for the node's
+   *      eth_call gas cap (one large allowlist makes its whole page revert)
+   * @param startIdx Index of the first protocol in registeredProtocols to include
+   * @param count Maximum number of protocols to include
+   * @return snapshots Returns origin name, allowlist address, owner address,
+   *         implementations and ABI-encoded conditions for each protocol in the page
+   */
+  function protocolsSnapshot(uint256 startIdx, uint256 count)
+    public
+    view
+    returns (ProtocolSnapshot[] memory snapshots)
+  {
+    uint256 protocolsLength = registeredProtocols.length;
+    if (startIdx >= protocolsLength) {
+      return snapshots;
+    }
+    uint256 endIdx = protocolsLength;
+    if (count < protocolsLength - startIdx) {
+      endIdx = startIdx + count;
+    }
+    snapshots = new ProtocolSnapshot[](endIdx - startIdx);
+    for (
+      uint256 protocolIdx = startIdx;
+      protocolIdx < endIdx;
+      protocolIdx++
+    ) {
+      string memory originName = registeredProtocols[protocolIdx];
+      address allowlistAddress = allowlistAddressByOriginName[originName];
+      IAllowlist allowlist = IAllowlist(allowlistAddress);
+      (bool success, bytes memory conditions) = allowlistAddress.staticcall(
+        abi.encodeWithSelector(IAllowlist.conditionsList.selector)
+      );
+      require(success, "Unable to fetch conditions");
+      snapshots[protocolIdx - startIdx] = ProtocolSnapshot({
+        originName: originName,
+        allowlistAddress: allowlistAddress,
+        ownerAddress: allowlist.ownerAddress(),
+        implementations: allowlist.implementationsList(),
+        conditions: conditions
+      });
+    }
+  }
+
   /**
    * @notice Allow protocol owners to override and replace existing allowlist
    * @dev This method is destructive and cannot be undone
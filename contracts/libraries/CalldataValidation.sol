@@ -125,6 +125,7 @@ library CalldataValidation {
 
   /**
    * @notice Test a target address and calldata against a specific condition and implementation
+   * @param allowlistAddress The address of the allowlist the condition belongs to
    * @param condition The condition to test
    * @param targetAddress Target address of the original method call
    * @param data Calldata of the original methodcall
@@ -133,6 +134,8 @@ library CalldataValidation {
           - Method selector check (to make sure the calldata method selector matches the condition method selector)
           - Target check (to make sure the target is valid)
           - Param check (to make sure the specified param is valid)
+   * @dev Resolves the implementation through "implementationById" so allowlists cloned
+   *      from every template version are supported
    */
   function testCondition(
     address allowlistAddress,
@@ -140,9 +143,22 @@ library CalldataValidation {
     address targetAddress,
     bytes calldata data
   ) public view returns (bool) {
-    string[][] memory requirements = condition.requirements;
     address implementationAddress = IAllowlist(allowlistAddress)
       .implementationById(condition.implementationId);
+    return
+      _testCondition(implementationAddress, condition, targetAddress, data);
+  }
+
+  /**
+   * @dev Internal method for testing a condition against an already resolved implementation address
+   */
+  function _testCondition(
+    address implementationAddress,
+    IAllowlist.Condition memory condition,
+    address targetAddress,
+    bytes calldata data
+  ) internal view returns (bool) {
+    string[][] memory requirements = condition.requirements;
     for (
       uint256 requirementIdx;
       requirementIdx < requirements.length;
@@ -182,6 +198,9 @@ library CalldataValidation {
    * @notice Test target address and calldata against all stored protocol conditions
    * @dev This is done to determine whether or not the target address and calldata are valid and whitelisted
    * @dev This is the primary method that should be called by integrators
+   * @dev Conditions and their implementation addresses are fetched in a single call
+   * @dev Allowlists cloned from templates without "conditionsListWithImplementations()"
+   *      fall back to "conditionsList()" and one "implementationById" call per condition
    * @param allowlistAddress The address of the allowlist to check calldata against
    * @param targetAddress The target address of the call
    * @param data The raw calldata to test
@@ -192,16 +211,38 @@ library CalldataValidation {
     address targetAddress,
     bytes calldata data
   ) public view returns (bool) {
-    IAllowlist.Condition[] memory _conditions = IAllowlist(allowlistAddress)
-      .conditionsList();
+    IAllowlist.Condition[] memory _conditions;
+    address[] memory implementationAddresses;
+    (bool success, bytes memory resultData) = allowlistAddress.staticcall(
+      abi.encodeWithSelector(
+        IAllowlist.conditionsListWithImplementations.selector
+      )
+    );
+    if (success && resultData.length > 0) {
+      (_conditions, implementationAddresses) = abi.decode(
+        resultData,
+        (IAllowlist.Condition[], address[])
+      );
+    } else {
+      _conditions = IAllowlist(allowlistAddress).conditionsList();
+      implementationAddresses = new address[](_conditions.length);
+      for (
+        uint256 conditionIdx;
+        conditionIdx < _conditions.length;
+        conditionIdx++
+      ) {
+        implementationAddresses[conditionIdx] = IAllowlist(allowlistAddress)
+          .implementationById(_conditions[conditionIdx].implementationId);
+      }
+    }
     for (
       uint256 conditionIdx;
       conditionIdx < _conditions.length;
       conditionIdx++
     ) {
       IAllowlist.Condition memory condition = _conditions[conditionIdx];
-      bool conditionPassed = testCondition(
-        allowlistAddress,
+      bool conditionPassed = _testCondition(
+        implementationAddresses[conditionIdx],
         condition,
         targetAddress,
         data
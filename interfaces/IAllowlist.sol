@@ -18,6 +18,16 @@ interface IAllowlist is IOwnable {
 
   function conditionsList() external view returns (Condition[] memory);
 
+  function conditionsListWithImplementations()
+    external
+    view
+    returns (Condition[] memory, address[] memory);
+
+  function implementationsList()
+    external
+    view
+    returns (Implementation[] memory);
+
   function addConditions(Condition[] memory) external;
 
   function setImplementations(Implementation[] memory) external;
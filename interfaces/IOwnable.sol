@@ -2,5 +2,7 @@
 pragma solidity 0.8.11;
 
 interface IOwnable {
+  function ownerAddress() external view returns (address);
+
   function setOwnerAddress(address _ownerAddress) external;
 }
@@ -0,0 +1,247 @@
+"""
+Export every protocol registered on an AllowlistRegistry to a columnar snapshot.
+
+Usage:
+    brownie run export_snapshot main <registry_address> [output_dir] [page_size] --network <network>
+
+Pages are fetched concurrently through AllowlistRegistry.protocolsSnapshot, all at the
+same block. Each page is a single eth_call, so page_size should stay small enough for the
+node's eth_call gas cap. A page which fails is split in half and retried, down to single
+protocols; the export only fails if a single protocol cannot be fetched.
+
+Each export is written to a new directory in output_dir/versions and published by
+atomically replacing output_dir/CURRENT, which holds the name of the live version.
+Every file is fsynced before CURRENT is replaced. Files are never rewritten in place,
+so readers holding memory maps of a previous version are unaffected. The previous
+version is kept, older versions written by this script are removed.
+
+A version directory contains flat little-endian files which can be memory-mapped directly:
+
+    allowlist_addresses.bin       20 bytes per protocol
+    owner_addresses.bin           20 bytes per protocol
+    origin_names.offsets/.data    uint64 offsets (protocols + 1) into UTF-8 data
+    conditions.offsets/.data      uint64 offsets (protocols + 1) into ABI-encoded Condition[]
+    implementations.offsets       uint64 offsets (protocols + 1) into implementation rows
+    implementation_addresses.bin  20 bytes per implementation row
+    implementation_ids.offsets/.data  uint64 offsets (rows + 1) into UTF-8 data
+    manifest.json                 describes the snapshot
+"""
+import json
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie import AllowlistRegistry, web3
+
+PAGE_SIZE = 25
+MAX_WORKERS = 8
+ADDRESS_SIZE = 20
+CURRENT_FILE_NAME = "CURRENT"
+VERSIONS_DIR_NAME = "versions"
+
+
+def fetch_snapshots(registry, page_size=PAGE_SIZE, block_number=None, max_workers=MAX_WORKERS):
+    """
+    Fetch snapshots for all registered protocols, one protocolsSnapshot call per page
+    Pages which fail (ie. by hitting the node's eth_call gas cap) are split in half and retried
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if block_number is None:
+        block_number = web3.eth.block_number
+    protocols_length = registry.registeredProtocolsLength(block_identifier=block_number)
+
+    def fetch_page(start_idx, count):
+        try:
+            return list(registry.protocolsSnapshot(start_idx, count, block_identifier=block_number))
+        except Exception as e:
+            if count == 1:
+                origin_name = registry.registeredProtocols(start_idx, block_identifier=block_number)
+                raise RuntimeError(
+                    f"Unable to fetch snapshot of {origin_name} (protocol {start_idx})"
+                ) from e
+            half = count // 2
+            return fetch_page(start_idx, half) + fetch_page(start_idx + half, count - half)
+
+    def fetch_full_page(start_idx):
+        return fetch_page(start_idx, min(page_size, protocols_length - start_idx))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pages = list(executor.map(fetch_full_page, range(0, protocols_length, page_size)))
+    return block_number, [snapshot for page in pages for snapshot in page]
+
+
+def _address_bytes(address):
+    return bytes.fromhex(str(address)[2:])
+
+
+def _fsync_file(f):
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _fsync_dir(path):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_offsets(path, offsets):
+    offsets = array("Q", offsets)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    with open(path, "wb") as f:
+        offsets.tofile(f)
+        _fsync_file(f)
+
+
+def _write_variable_column(output_dir, name, values):
+    offsets = [0]
+    with open(os.path.join(output_dir, f"{name}.data"), "wb") as f:
+        for value in values:
+            f.write(value)
+            offsets.append(offsets[-1] + len(value))
+        _fsync_file(f)
+    _write_offsets(os.path.join(output_dir, f"{name}.offsets"), offsets)
+
+
+def _write_fixed_column(output_dir, name, values):
+    with open(os.path.join(output_dir, f"{name}.bin"), "wb") as f:
+        for value in values:
+            f.write(value)
+        _fsync_file(f)
+
+
+def _current_version(output_dir):
+    try:
+        with open(os.path.join(output_dir, CURRENT_FILE_NAME)) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def _publish_version(output_dir, version):
+    """
+    Atomically point output_dir/CURRENT at version
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{CURRENT_FILE_NAME}.", dir=output_dir)
+    with os.fdopen(fd, "w") as f:
+        f.write(version)
+        _fsync_file(f)
+    os.replace(tmp_path, os.path.join(output_dir, CURRENT_FILE_NAME))
+    _fsync_dir(output_dir)
+
+
+def _is_version_dir(path, version):
+    """
+    Only directories holding a manifest written for that version are treated as versions
+    """
+    try:
+        with open(os.path.join(path, "manifest.json")) as f:
+            return json.load(f).get("version") == version
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+def _remove_stale_versions(versions_dir, keep_versions):
+    for entry in os.scandir(versions_dir):
+        if (
+            entry.is_dir(follow_symlinks=False)
+            and entry.name not in keep_versions
+            and _is_version_dir(entry.path, entry.name)
+        ):
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def write_snapshot(output_dir, snapshots, block_number, registry_address):
+    """
+    Write protocol snapshots to a new version directory in output_dir and publish it
+    """
+    versions_dir = os.path.join(output_dir, VERSIONS_DIR_NAME)
+    os.makedirs(versions_dir, exist_ok=True)
+    previous_version = _current_version(output_dir)
+    version_dir = tempfile.mkdtemp(prefix=f"{block_number}-", dir=versions_dir)
+    os.chmod(version_dir, 0o755)
+    version = os.path.basename(version_dir)
+
+    origin_names, allowlist_addresses, owner_addresses, conditions = [], [], [], []
+    implementation_offsets, implementation_ids, implementation_addresses = [0], [], []
+    for origin_name, allowlist_address, owner_address, implementations, encoded_conditions in snapshots:
+        origin_names.append(origin_name.encode())
+        allowlist_addresses.append(_address_bytes(allowlist_address))
+        owner_addresses.append(_address_bytes(owner_address))
+        conditions.append(bytes(encoded_conditions))
+        for implementation_id, implementation_address in implementations:
+            implementation_ids.append(implementation_id.encode())
+            implementation_addresses.append(_address_bytes(implementation_address))
+        implementation_offsets.append(len(implementation_ids))
+
+    _write_variable_column(version_dir, "origin_names", origin_names)
+    _write_fixed_column(version_dir, "allowlist_addresses", allowlist_addresses)
+    _write_fixed_column(version_dir, "owner_addresses", owner_addresses)
+    _write_variable_column(version_dir, "conditions", conditions)
+    _write_offsets(os.path.join(version_dir, "implementations.offsets"), implementation_offsets)
+    _write_variable_column(version_dir, "implementation_ids", implementation_ids)
+    _write_fixed_column(version_dir, "implementation_addresses", implementation_addresses)
+
+    manifest = {
+        "version": version,
+        "registryAddress": str(registry_address),
+        "blockNumber": block_number,
+        "protocolsLength": len(origin_names),
+        "implementationsLength": len(implementation_ids),
+    }
+    with open(os.path.join(version_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+        _fsync_file(f)
+
+    # Make the new version durable before CURRENT points at it
+    _fsync_dir(version_dir)
+    _fsync_dir(versions_dir)
+    _fsync_dir(output_dir)
+    _publish_version(output_dir, version)
+    _remove_stale_versions(versions_dir, {version, previous_version})
+    return manifest
+
+
+def open_snapshot(output_dir):
+    """
+    Memory-map the current snapshot written by write_snapshot
+    Returns the manifest and a dict of file name => read-only mmap (None for empty files)
+    """
+    version = _current_version(output_dir)
+    if version is None:
+        raise FileNotFoundError(f"No snapshot has been published to {output_dir}")
+    version_dir = os.path.join(output_dir, VERSIONS_DIR_NAME, version)
+    with open(os.path.join(version_dir, "manifest.json")) as f:
+        manifest = json.load(f)
+    columns = {}
+    for file_name in os.listdir(version_dir):
+        if file_name == "manifest.json":
+            continue
+        with open(os.path.join(version_dir, file_name), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                columns[file_name] = None
+            else:
+                columns[file_name] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return manifest, columns
+
+
+def export_snapshot(registry, output_dir, page_size=PAGE_SIZE, max_workers=MAX_WORKERS):
+    block_number, snapshots = fetch_snapshots(registry, page_size, max_workers=max_workers)
+    return write_snapshot(output_dir, snapshots, block_number, registry.address)
+
+
+def main(registry_address, output_dir="snapshot", page_size=PAGE_SIZE):
+    registry = AllowlistRegistry.at(registry_address)
+    manifest = export_snapshot(registry, output_dir, int(page_size))
+    print(
+        f"Exported {manifest['protocolsLength']} protocols at block "
+        f"{manifest['blockNumber']} to {output_dir}"
+    )
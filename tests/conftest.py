@@ -1,3 +1,4 @@
+import eth_abi
 import pytest
 from brownie import web3
 
@@ -92,3 +93,16 @@ def implementation(YearnAllowlistImplementation, rando):
 @pytest.fixture
 def implementation_id():
     return "VAULT_VALIDATIONS"
+
+
+###################
+# Encoding
+###################
+
+@pytest.fixture
+def decode_conditions():
+    def _decode_conditions(data):
+        # eth-abi >= 4 renamed decode_abi to decode
+        decode = getattr(eth_abi, "decode", None) or eth_abi.decode_abi
+        return decode(["(string,string,string,string[],string[][])[]"], bytes(data))[0]
+    return _decode_conditions
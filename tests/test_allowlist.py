@@ -1,4 +1,5 @@
 import brownie
+from brownie import web3
 
 def test_set_implementation(allowlist, protocol_owner_address, implementation, rando, YearnAllowlistImplementation, EmptyAllowlistImplementation, implementation_id):
     # Test initial allowlist implementation length
@@ -278,6 +279,63 @@ def test_delete_condition(allowlist, implementation_id, protocol_owner_address,
     assert allowlist.conditionsLength() == 3
     allowlist.deleteCondition("VAULT_DEPOSIT_1", {"from": protocol_owner_address})
     assert allowlist.conditionsLength() == 2
+
+def test_condition_keys(allowlist, implementation, implementation_id, protocol_owner_address):
+    condition_valid_0 = (
+        "VAULT_DEPOSIT_0",
+        implementation_id,
+        "deposit",
+        ["uint256"],
+        [
+            ["target", "isVault"]
+        ]
+    )
+    condition_valid_1 = (
+        "VAULT_DEPOSIT_1",
+        implementation_id,
+        "deposit",
+        ["uint256"],
+        [
+            ["target", "isVault"]
+        ]
+    )
+    condition_valid_2 = (
+        "VAULT_DEPOSIT_2",
+        implementation_id,
+        "deposit",
+        ["uint256"],
+        [
+            ["target", "isVault"]
+        ]
+    )
+    allowlist.addConditions([condition_valid_0, condition_valid_1, condition_valid_2], {"from": protocol_owner_address})
+
+    # Keys are keccak256 of the ID
+    key_0 = web3.keccak(text="VAULT_DEPOSIT_0")
+    key_2 = web3.keccak(text="VAULT_DEPOSIT_2")
+    assert allowlist.keyById("VAULT_DEPOSIT_0") == key_0.hex()
+    assert allowlist.conditionsKeysList()[0] == key_0.hex()
+    assert allowlist.conditionByKey(key_0)[0] == "VAULT_DEPOSIT_0"
+    assert allowlist.conditionExists("VAULT_DEPOSIT_0") == True
+
+    # Implementations can be looked up by key or by ID
+    implementation_key = web3.keccak(text=implementation_id)
+    assert allowlist.implementationsKeysList()[0] == implementation_key.hex()
+    assert allowlist.implementationByKey(implementation_key) == implementation
+    assert allowlist.implementationIdByKey(implementation_key) == implementation_id
+
+    # Conditions can be fetched along with their implementation addresses
+    conditions, implementation_addresses = allowlist.conditionsListWithImplementations()
+    assert conditions == allowlist.conditionsList()
+    assert implementation_addresses == [implementation] * 3
+
+    # Deleting a condition moves the last condition into its slot
+    allowlist.deleteCondition("VAULT_DEPOSIT_0", {"from": protocol_owner_address})
+    assert allowlist.conditionExists("VAULT_DEPOSIT_0") == False
+    assert allowlist.conditionsIdsList() == ["VAULT_DEPOSIT_2", "VAULT_DEPOSIT_1"]
+    assert allowlist.conditionPositionByKey(key_2) == 1
+    with brownie.reverts():
+        allowlist.deleteCondition("VAULT_DEPOSIT_0", {"from": protocol_owner_address})
     
 def test_delete_conditions(allowlist, implementation_id, protocol_owner_address, rando):
     condition_valid_0 = (
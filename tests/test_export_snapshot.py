@@ -0,0 +1,158 @@
+import os
+from array import array
+
+import pytest
+from scripts.export_snapshot import export_snapshot, fetch_snapshots, open_snapshot, write_snapshot
+
+
+def offsets(column):
+    return list(array("Q", column[:]))
+
+
+class PagedRegistry:
+    """
+    Stand-in registry serving protocolsSnapshot pages from a list
+    """
+    def __init__(self, snapshots, max_count=None, failing_idxs=()):
+        self.snapshots = snapshots
+        self.max_count = max_count
+        self.failing_idxs = set(failing_idxs)
+        self.calls = []
+
+    def registeredProtocolsLength(self, block_identifier=None):
+        return len(self.snapshots)
+
+    def registeredProtocols(self, protocol_idx, block_identifier=None):
+        return self.snapshots[protocol_idx][0]
+
+    def protocolsSnapshot(self, start_idx, count, block_identifier=None):
+        self.calls.append((start_idx, count, block_identifier))
+        # Simulate pages hitting the eth_call gas cap and protocols which always revert
+        if self.max_count is not None and count > self.max_count:
+            raise ValueError("out of gas")
+        if self.failing_idxs.intersection(range(start_idx, start_idx + count)):
+            raise ValueError("execution reverted")
+        return self.snapshots[start_idx:start_idx + count]
+
+
+def paged_snapshots(length):
+    return [
+        (f"protocol{idx}.finance", f"0x{idx:040x}", f"0x{idx + 100:040x}", [], b"")
+        for idx in range(length)
+    ]
+
+
+def test_fetch_snapshots_pages():
+    snapshots = paged_snapshots(5)
+    registry = PagedRegistry(snapshots)
+
+    # Pages must all be fetched at the same block and flattened in order
+    block_number, fetched = fetch_snapshots(registry, page_size=2, block_number=123)
+    assert block_number == 123
+    assert fetched == snapshots
+    assert sorted(registry.calls) == [(0, 2, 123), (2, 2, 123), (4, 1, 123)]
+
+def test_fetch_snapshots_page_size():
+    registry = PagedRegistry(paged_snapshots(2))
+    for page_size in [0, -1]:
+        with pytest.raises(ValueError):
+            fetch_snapshots(registry, page_size=page_size, block_number=123)
+
+def test_fetch_snapshots_splits_failing_pages():
+    snapshots = paged_snapshots(5)
+
+    # A page which is too large for the gas cap is split until it can be fetched
+    registry = PagedRegistry(snapshots, max_count=2)
+    _, fetched = fetch_snapshots(registry, page_size=5, block_number=123)
+    assert fetched == snapshots
+
+    # A single protocol which cannot be fetched fails the export and is named
+    registry = PagedRegistry(snapshots, failing_idxs=[3])
+    with pytest.raises(RuntimeError, match="protocol3.finance"):
+        fetch_snapshots(registry, page_size=5, block_number=123)
+    assert (3, 1, 123) in registry.calls
+
+def test_export_snapshot(allowlist_registry, allowlist, implementation, implementation_id, protocol_owner_address, origin_name, tmp_path, decode_conditions):
+    condition_0 = (
+        "CONDITION_0",
+        implementation_id,
+        "approve",
+        ["address", "uint256"],
+        [
+            ["target", "isVaultToken"], 
+        ]
+    )
+    condition_1 = (
+        "CONDITION_1",
+        implementation_id,
+        "approve",
+        ["address", "uint256"],
+        [
+            ["target", "isVaultToken"], 
+            ["param", "isVault", "0"]
+        ]
+    )
+    allowlist.addConditions([condition_0, condition_1], {"from": protocol_owner_address})
+
+    manifest = export_snapshot(allowlist_registry, tmp_path, page_size=1)
+    assert manifest["protocolsLength"] == 1
+    assert manifest["implementationsLength"] == 1
+
+    # Snapshot columns must be readable through memory maps
+    manifest, columns = open_snapshot(tmp_path)
+    assert offsets(columns["origin_names.offsets"]) == [0, len(origin_name)]
+    assert columns["origin_names.data"][:] == origin_name.encode()
+    assert columns["allowlist_addresses.bin"][:] == bytes.fromhex(allowlist.address[2:])
+    assert columns["owner_addresses.bin"][:] == bytes.fromhex(protocol_owner_address[2:])
+    assert offsets(columns["implementations.offsets"]) == [0, 1]
+    assert offsets(columns["implementation_ids.offsets"]) == [0, len(implementation_id)]
+    assert columns["implementation_ids.data"][:] == implementation_id.encode()
+    assert columns["implementation_addresses.bin"][:] == bytes.fromhex(implementation.address[2:])
+
+    # Conditions must decode back to the allowlist conditions
+    conditions_offsets = offsets(columns["conditions.offsets"])
+    assert conditions_offsets[0] == 0
+    assert conditions_offsets[1] == len(columns["conditions.data"])
+    assert allowlist.conditionsList() == decode_conditions(columns["conditions.data"][:])
+
+def test_export_snapshot_keeps_open_mappings(allowlist_registry, allowlist, implementation_id, protocol_owner_address, tmp_path, decode_conditions):
+    condition = (
+        "CONDITION_0",
+        implementation_id,
+        "approve",
+        ["address", "uint256"],
+        [
+            ["target", "isVaultToken"], 
+        ]
+    )
+    export_snapshot(allowlist_registry, tmp_path)
+    _, old_columns = open_snapshot(tmp_path)
+    old_conditions = old_columns["conditions.data"][:]
+
+    # A second export must not touch files mapped by readers of the previous export
+    allowlist.addCondition(condition, {"from": protocol_owner_address})
+    export_snapshot(allowlist_registry, tmp_path)
+    assert old_columns["conditions.data"][:] == old_conditions
+    assert len(decode_conditions(old_conditions)) == 0
+
+    # New readers must see the new export
+    _, new_columns = open_snapshot(tmp_path)
+    assert allowlist.conditionsList() == decode_conditions(new_columns["conditions.data"][:])
+
+def test_write_snapshot_keeps_foreign_directories(tmp_path):
+    foreign_file = tmp_path / "important_dir" / "file.txt"
+    foreign_file.parent.mkdir()
+    foreign_file.write_text("keep")
+    foreign_version = tmp_path / "versions" / "1-foreign"
+    foreign_version.mkdir(parents=True)
+
+    # Only versions written by write_snapshot may be removed
+    for block_number in range(4):
+        write_snapshot(tmp_path, paged_snapshots(1), block_number, "0x" + "00" * 20)
+    assert foreign_file.read_text() == "keep"
+    assert foreign_version.is_dir()
+    versions = os.listdir(tmp_path / "versions")
+    assert len(versions) == 3
+    manifest, _ = open_snapshot(tmp_path)
+    assert manifest["blockNumber"] == 3
+    assert manifest["version"] in versions
@@ -73,3 +73,55 @@ def test_reregister_protocol(allowlist_registry, implementation_id, protocol_own
         allowlist_registry.reregisterProtocol(origin_name, implementations, conditions, {"from": rando})
     allowlist_registry.reregisterProtocol(origin_name, implementations, conditions, {"from": protocol_owner_address})
     
+
+def test_protocols_snapshot(allowlist_registry, allowlist, implementation, implementation_id, protocol_owner_address, origin_name, decode_conditions):
+    condition = (
+        "CONDITION_0",
+        implementation_id,
+        "approve",
+        ["address", "uint256"],
+        [
+            ["target", "isVaultToken"], 
+        ]
+    )
+    allowlist.addCondition(condition, {"from": protocol_owner_address})
+    assert allowlist_registry.registeredProtocolsLength() == 1
+
+    # Snapshot must contain allowlist address, owner, implementations and encoded conditions
+    snapshots = allowlist_registry.protocolsSnapshot(0, 10)
+    assert len(snapshots) == 1
+    snapshot = snapshots[0]
+    assert snapshot[0] == origin_name
+    assert snapshot[1] == allowlist.address
+    assert snapshot[2] == protocol_owner_address
+    assert snapshot[3] == [(implementation_id, implementation)]
+    assert allowlist.conditionsList() == decode_conditions(snapshot[4])
+
+    # Pages past the end of the list are empty
+    assert len(allowlist_registry.protocolsSnapshot(1, 10)) == 0
+    assert len(allowlist_registry.protocolsSnapshot(0, 0)) == 0
+
+    # Counts larger than the remaining protocols must not overflow
+    assert len(allowlist_registry.protocolsSnapshot(0, 2**256 - 1)) == 1
+
+def test_protocols_snapshot_truncation(allowlist_registry, allowlist, protocol_owner_address, origin_name):
+    # Register a second protocol
+    second_origin_name = "ychad.eth"
+    second_owner_address = allowlist_registry.protocolOwnerAddressByOriginName(second_origin_name)
+    assert second_owner_address != ZERO_ADDRESS
+    allowlist_registry.registerProtocol(second_origin_name, {"from": second_owner_address})
+    assert allowlist_registry.registeredProtocolsLength() == 2
+
+    # Re-registering must not add protocols to the list
+    allowlist_registry.reregisterProtocol(origin_name, [], [], {"from": protocol_owner_address})
+    assert allowlist_registry.registeredProtocolsLength() == 2
+
+    # Pages must be truncated to count
+    snapshots = allowlist_registry.protocolsSnapshot(0, 1)
+    assert len(snapshots) == 1
+    assert snapshots[0][0] == origin_name
+    assert snapshots[0][1] == allowlist_registry.allowlistAddressByOriginName(origin_name)
+    snapshots = allowlist_registry.protocolsSnapshot(1, 1)
+    assert len(snapshots) == 1
+    assert snapshots[0][0] == second_origin_name
+    assert len(allowlist_registry.protocolsSnapshot(0, 2)) == 2